@@ -1,9 +1,31 @@
 import streamlit as st
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+import http.cookiejar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
+import soupsieve as sv
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 from urllib.parse import urlparse
 import time
+import re
+import html
+import codecs
+import collections
+import io
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Page configuration
 st.set_page_config(
@@ -13,261 +35,1256 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Issues are stored column-wise: one list per field, one position per issue
+ISSUE_COLUMNS = ('Type', 'Severity', 'Element', 'Description', 'Impact', 'Solution', 'Location')
+REPORT_COLUMNS = ['Type', 'Severity', 'Location', 'Description', 'Impact', 'Solution']
+SEVERITIES = ('High', 'Medium', 'Low')
+
+# Constant fields per issue kind: (type, severity, description, impact, solution).
+# Descriptions may contain {placeholders} filled in by AccessibilityAnalyzer._emit.
+ISSUE_TEMPLATES = {
+    'missing_alt': (
+        'Missing Alt Text',
+        'High',
+        'Image missing alt attribute',
+        'Screen readers cannot describe this image to users',
+        'Add descriptive alt text or alt="" for decorative images'
+    ),
+    'empty_alt': (
+        'Empty Alt Text',
+        'Low',
+        'Image has empty alt attribute',
+        'Marked as decorative - ensure this is intentional',
+        'Verify if image is truly decorative or needs description'
+    ),
+    'heading_skip': (
+        'Heading Level Skip',
+        'Medium',
+        'Heading jumps from h{prev_level} to h{current_level}',
+        'Breaks logical heading hierarchy',
+        'Use sequential heading levels (h1, h2, h3, etc.)'
+    ),
+    'no_headings': (
+        'No Headings',
+        'High',
+        'No heading elements found',
+        'Users cannot navigate page structure with assistive technology',
+        'Add proper heading hierarchy starting with h1'
+    ),
+    'missing_h1': (
+        'Missing H1',
+        'High',
+        'No h1 element found',
+        'Page lacks main heading for screen readers',
+        'Add one h1 element as the main page heading'
+    ),
+    'multiple_h1': (
+        'Multiple H1',
+        'Medium',
+        'Found {h1_count} h1 elements',
+        'Multiple main headings can confuse navigation',
+        'Use only one h1 per page'
+    ),
+    'unlabeled_input': (
+        'Unlabeled Input',
+        'High',
+        '{tag} element lacks proper labeling',
+        'Users cannot understand the purpose of this input',
+        'Add a label element, aria-label, or aria-labelledby attribute'
+    ),
+    'non_semantic_clickable': (
+        'Non-semantic Clickable',
+        'High',
+        'Clickable {tag} element with issues: {problems}',
+        'Element not accessible via keyboard or screen readers',
+        'Use button/a elements or add role="button" and tabindex="0"'
+    ),
+    'contrast': (
+        'Potential Contrast Issue',
+        'Medium',
+        'Element has custom colors that may have contrast issues',
+        'Text may be difficult to read for visually impaired users',
+        'Verify color contrast ratio meets WCAG standards (4.5:1 for normal text)'
+    ),
+    'link_without_href': (
+        'Link Without Href',
+        'Medium',
+        'Link element missing href attribute',
+        'Link is not functional for keyboard users',
+        'Add href attribute or use button element instead'
+    ),
+    'empty_link_text': (
+        'Empty Link Text',
+        'High',
+        'Link has no accessible text',
+        'Screen readers cannot describe the link purpose',
+        'Add descriptive text or aria-label attribute'
+    ),
+    'table_without_headers': (
+        'Table Without Headers',
+        'Medium',
+        'Table missing header cells (th elements)',
+        'Screen readers cannot properly navigate table data',
+        'Add th elements for column/row headers'
+    ),
+    'table_without_caption': (
+        'Table Without Caption',
+        'Low',
+        'Table missing caption element',
+        'Users may not understand table purpose',
+        'Add caption element describing table content'
+    )
+}
+
+# Checks in the order their issues are reported; each check's issues stay in document order
+REPORT_SECTIONS = (
+    'images', 'headings', 'heading_skips', 'forms',
+    'clickable_divs', 'clickable_spans', 'contrast', 'links', 'tables'
+)
+ISSUE_SECTIONS = {
+    'missing_alt': 'images',
+    'empty_alt': 'images',
+    'no_headings': 'headings',
+    'missing_h1': 'headings',
+    'multiple_h1': 'headings',
+    'heading_skip': 'heading_skips',
+    'unlabeled_input': 'forms',
+    'contrast': 'contrast',
+    'link_without_href': 'links',
+    'empty_link_text': 'links',
+    'table_without_headers': 'tables',
+    'table_without_caption': 'tables'
+}
+
+def empty_issues():
+    """Create an empty columnar issue store"""
+    return {column: [] for column in ISSUE_COLUMNS}
+
+def empty_counts():
+    """Create zeroed per-severity issue counts"""
+    return dict.fromkeys(SEVERITIES, 0)
+
+# BeautifulSoup keeps whitespace-only strings as they are only inside these elements
+PRESERVE_WHITESPACE_TAGS = frozenset(('pre', 'textarea'))
+
+def collapse_whitespace(string):
+    """Reduce a whitespace-only string to one newline or space, as BeautifulSoup does"""
+    if string.strip(' \n\t\f\r'):
+        return string
+    return '\n' if '\n' in string else ' '
+
+def text_preview(tag, limit=30):
+    """Same as tag.get_text()[:limit], but stops reading strings once limit is reached"""
+    parts = []
+    remaining = limit
+    for string in tag.strings:
+        parts.append(string[:remaining])
+        remaining -= len(parts[-1])
+        if remaining <= 0:
+            break
+    return ''.join(parts)
+
+class TextPrefix:
+    """Bounded prefix of an element's text, fed one string at a time in document order"""
+    
+    def __init__(self, limit=30):
+        self.limit = limit
+        self.raw = ''         # first `limit` characters of the text
+        self.stripped = ''    # first `limit` characters after leading whitespace
+        self.rest = ''        # first non-whitespace character after self.stripped, if any
+    
+    def add(self, string):
+        if len(self.raw) < self.limit:
+            self.raw += string[:self.limit - len(self.raw)]
+        if not self.stripped:
+            string = string.lstrip()
+        room = self.limit - len(self.stripped)
+        if room > 0:
+            self.stripped += string[:room]
+            string = string[room:]
+        if not self.rest:
+            self.rest = string.lstrip()[:1]
+    
+    def text(self):
+        """A string whose strip()[:limit] and emptiness match those of the full text"""
+        return self.stripped + self.rest
+
+def element_preview(name, attrs, limit=80, max_attrs=4):
+    """Build a short opening-tag preview from a tag name and its attributes, without serializing the element"""
+    parts = [name]
+    for key, value in list(attrs.items())[:max_attrs]:
+        if isinstance(value, list):
+            value = ' '.join(value)
+        parts.append(f'{key}="{value}"')
+    return f'<{" ".join(parts)}>'[:limit]
+
 class AccessibilityAnalyzer:
+    HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+    FORM_TAGS = ('input', 'textarea', 'select')
+    
+    # Elements whose strings BeautifulSoup leaves out of get_text()
+    NON_TEXT_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+    
+    # Selectors compiled once and shared by every analyzer instance
+    LABEL_FOR_SELECTOR = sv.compile('label[for]')
+    DESCENDANT_SELECTORS = {
+        'th': sv.compile('th'),
+        'caption': sv.compile('caption')
+    }
+    
+    # Inline style attribute values in the raw HTML (double, single or unquoted)
+    STYLE_ATTR_RE = re.compile(r'''\bstyle\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.IGNORECASE)
+    
     def __init__(self, url, html_content):
         self.url = url
-        self.soup = BeautifulSoup(html_content, 'html.parser')
-        self.issues = []
+        self.html = html_content
+        self.parse(html_content)
+        self.issues = empty_issues()
+        self.counts = empty_counts()
+        self.sections = {section: [] for section in REPORT_SECTIONS}
+        self.label_for = {}
+        
+        # Running counters for the single document walk
+        self.image_count = 0
+        self.heading_count = 0
+        self.h1_count = 0
+        self.prev_heading_level = 0
+        self.input_count = 0
+        self.clickable_counts = {'div': 0, 'span': 0}
+        self.link_count = 0
+        self.table_count = 0
+        self.check_styles = True
+        
+        # Inline styles gathered during the walk and tested together afterwards
+        self.styled_tags = []
+        self.styles = []
+    
+    def parse(self, html_content):
+        """Build the document tree the checks run against"""
+        self.soup = BeautifulSoup(html_content, 'lxml')
     
     def analyze(self):
-        """Run all accessibility checks"""
-        self.check_images()
+        """Run all accessibility checks in a single pass over the document"""
+        self.check_styles = self.has_contrast_candidates()
+        self.label_for = {label['for']: label for label in self.LABEL_FOR_SELECTOR.select(self.soup)}
+        
+        for tag, in_label in self._walk():
+            self._dispatch(tag, in_label)
+        
+        self.check_color_contrast_batch()
         self.check_headings()
-        self.check_form_labels()
-        self.check_clickable_elements()
-        self.check_color_contrast()
-        self.check_links()
-        self.check_tables()
-        return self.issues
-    
-    def check_images(self):
-        """Check for missing alt text on images"""
-        images = self.soup.find_all('img')
-        for i, img in enumerate(images):
-            src = img.get('src', f'Image #{i+1}')
-            alt = img.get('alt')
+        return self._finish()
+    
+    def _emit(self, kind, element, location, section=None, **details):
+        """Buffer one issue of the given kind under the check that found it"""
+        type_, severity, description, impact, solution = ISSUE_TEMPLATES[kind]
+        if details:
+            description = description.format(**details)
+        
+        row = (type_, severity, element, description, impact, solution, location)
+        self._rows(section or ISSUE_SECTIONS[kind]).append(row)
+        self.counts[severity] += 1
+    
+    def _rows(self, section):
+        """List that newly emitted rows of a section are appended to"""
+        return self.sections[section]
+    
+    def _finish(self):
+        """Write the buffered issues to the columnar store, grouped by check in report order"""
+        # Clickables are numbered per tag while walking; every div is reported before any span
+        offsets = {'clickable_divs': 0, 'clickable_spans': self.clickable_counts['div']}
+        for section, offset in offsets.items():
+            self.sections[section] = [
+                row[:-1] + (f'Clickable element {row[-1] + offset}',) for row in self.sections[section]
+            ]
+        
+        issues = self.issues
+        for section in REPORT_SECTIONS:
+            for row in self.sections[section]:
+                for column, value in zip(ISSUE_COLUMNS, row):
+                    issues[column].append(value)
+        return issues
+    
+    # Tree accessors; subclasses override these to run the same checks on another parser
+    
+    def _name(self, node):
+        return node.name
+    
+    def _attrs(self, node):
+        return node.attrs
+    
+    def _text(self, node, limit=None):
+        return text_preview(node, limit) if limit else node.get_text()
+    
+    def _contains(self, node, tag_name):
+        return self.DESCENDANT_SELECTORS[tag_name].select_one(node) is not None
+    
+    def _walk(self):
+        """Yield elements in document order, flagging those nested inside a label"""
+        stack = [(self.soup, False)]
+        while stack:
+            node, in_label = stack.pop()
+            if node is not self.soup:
+                yield node, in_label
             
-            if alt is None:
-                self.issues.append({
-                    'type': 'Missing Alt Text',
-                    'severity': 'High',
-                    'element': f'<img src="{src[:50]}...">',
-                    'description': 'Image missing alt attribute',
-                    'impact': 'Screen readers cannot describe this image to users',
-                    'solution': 'Add descriptive alt text or alt="" for decorative images',
-                    'location': f'Image {i+1}'
-                })
-            elif alt.strip() == '':
-                self.issues.append({
-                    'type': 'Empty Alt Text',
-                    'severity': 'Low',
-                    'element': f'<img src="{src[:50]}..." alt="">',
-                    'description': 'Image has empty alt attribute',
-                    'impact': 'Marked as decorative - ensure this is intentional',
-                    'solution': 'Verify if image is truly decorative or needs description',
-                    'location': f'Image {i+1}'
-                })
+            child_in_label = in_label or node.name == 'label'
+            stack.extend(
+                (child, child_in_label) for child in reversed(node.contents) if isinstance(child, Tag)
+            )
+    
+    def _dispatch(self, tag, in_label=False):
+        """Route an element to the checks that apply to it"""
+        name = tag.name
+        attrs = tag.attrs
+        if name == 'img':
+            self.image_count += 1
+            self.check_image(tag, self.image_count)
+        elif name in self.HEADING_TAGS:
+            self.heading_count += 1
+            self.check_heading(tag, self.heading_count)
+        elif name in self.FORM_TAGS:
+            self.input_count += 1
+            self.check_form_label(tag, self.input_count, in_label)
+        elif name == 'a':
+            self.link_count += 1
+            self.check_link(tag, self.link_count)
+        elif name == 'table':
+            self.table_count += 1
+            self.check_table(tag, self.table_count)
+        elif name in ('div', 'span') and 'onclick' in attrs:
+            self.clickable_counts[name] += 1
+            self.check_clickable(tag, self.clickable_counts[name])
+        
+        if self.check_styles and 'style' in attrs:
+            self.styled_tags.append(name)
+            self.styles.append(attrs['style'])
+    
+    def check_image(self, img, index):
+        """Check for missing alt text on an image"""
+        attrs = self._attrs(img)
+        src = attrs.get('src', f'Image #{index}')
+        alt = attrs.get('alt')
+        
+        if alt is None:
+            self._emit('missing_alt', element=f'<img src="{src[:50]}...">', location=f'Image {index}')
+        elif alt.strip() == '':
+            self._emit('empty_alt', element=f'<img src="{src[:50]}..." alt="">', location=f'Image {index}')
+    
+    def check_heading(self, heading, index):
+        """Track heading counts and check for heading level skips"""
+        name = self._name(heading)
+        current_level = int(name[1])
+        if current_level == 1:
+            self.h1_count += 1
+        
+        prev_level = self.prev_heading_level
+        if prev_level > 0 and current_level > prev_level + 1:
+            self._emit(
+                'heading_skip',
+                element=f'<{name}>{self._text(heading, 30)}...</{name}>',
+                location=f'Heading {index}',
+                prev_level=prev_level,
+                current_level=current_level
+            )
+        self.prev_heading_level = current_level
     
     def check_headings(self):
-        """Check heading structure"""
-        headings = self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        
-        if not headings:
-            self.issues.append({
-                'type': 'No Headings',
-                'severity': 'High',
-                'element': 'Document',
-                'description': 'No heading elements found',
-                'impact': 'Users cannot navigate page structure with assistive technology',
-                'solution': 'Add proper heading hierarchy starting with h1',
-                'location': 'Entire document'
-            })
+        """Check overall heading structure once the document has been walked"""
+        if not self.prev_heading_level:
+            self._emit('no_headings', element='Document', location='Entire document')
+            return
+        
+        # h1_count is accumulated during the walk, so no extra search is needed here
+        if self.h1_count == 0:
+            self._emit('missing_h1', element='Document', location='Document head')
+        elif self.h1_count > 1:
+            self._emit('multiple_h1', element='Document', location='Multiple locations', h1_count=self.h1_count)
+    
+    def check_form_label(self, input_elem, index, in_label=False):
+        """Check a form input for proper labeling"""
+        attrs = self._attrs(input_elem)
+        input_type = attrs.get('type', 'text')
+        if input_type in ['hidden', 'submit', 'button']:
             return
         
-        h1_count = len(self.soup.find_all('h1'))
-        if h1_count == 0:
-            self.issues.append({
-                'type': 'Missing H1',
-                'severity': 'High',
-                'element': 'Document',
-                'description': 'No h1 element found',
-                'impact': 'Page lacks main heading for screen readers',
-                'solution': 'Add one h1 element as the main page heading',
-                'location': 'Document head'
-            })
-        elif h1_count > 1:
-            self.issues.append({
-                'type': 'Multiple H1',
-                'severity': 'Medium',
-                'element': 'Document',
-                'description': f'Found {h1_count} h1 elements',
-                'impact': 'Multiple main headings can confuse navigation',
-                'solution': 'Use only one h1 per page',
-                'location': 'Multiple locations'
-            })
-        
-        # Check for heading level skips
-        prev_level = 0
-        for i, heading in enumerate(headings):
-            current_level = int(heading.name[1])
+        input_id = attrs.get('id')
+        aria_label = attrs.get('aria-label')
+        aria_labelledby = attrs.get('aria-labelledby')
+        
+        # Check for associated label
+        has_label = False
+        if input_id and input_id in self.label_for:
+            has_label = True
+        
+        # Check for parent label (tracked during the walk)
+        if in_label:
+            has_label = True
+        
+        if not has_label and not aria_label and not aria_labelledby:
+            self._emit(
+                'unlabeled_input',
+                element=element_preview(self._name(input_elem), attrs) + '...',
+                location=f'Form input {index}',
+                tag=self._name(input_elem)
+            )
+    
+    def check_clickable(self, elem, index):
+        """Check a non-semantic clickable element; index counts clickables of the same tag"""
+        name = self._name(elem)
+        attrs = self._attrs(elem)
+        role = attrs.get('role')
+        tabindex = attrs.get('tabindex')
+        
+        issues_found = []
+        if not role or role not in ['button', 'link']:
+            issues_found.append('missing appropriate role')
+        if tabindex is None or tabindex == '-1':
+            issues_found.append('not keyboard accessible')
+        
+        if issues_found:
+            self._emit(
+                'non_semantic_clickable',
+                element=f'<{name}>{self._text(elem, 30)}...</{name}>',
+                location=index,
+                section=f'clickable_{name}s',
+                tag=name,
+                problems=", ".join(issues_found)
+            )
+    
+    def has_contrast_candidates(self):
+        """Scan the raw HTML for any inline style that sets both color and background"""
+        for match in self.STYLE_ATTR_RE.finditer(self.html):
+            style = match.group(match.lastindex)
+            if '&' in style:
+                # Parsers decode character references in attribute values, e.g. color&#58;red
+                style = html.unescape(style)
+            if 'color:' in style and 'background' in style:
+                return True
+        return False
+    
+    def check_color_contrast_batch(self):
+        """Color contrast check over all collected styles at once, using Arrow string kernels"""
+        if not self.styles:
+            return
+        
+        styles = pa.array(self.styles, type=pa.string())
+        mask = pc.and_(pc.match_substring(styles, 'color:'), pc.match_substring(styles, 'background'))
+        for i in pc.indices_nonzero(mask).to_pylist():
+            self._emit(
+                'contrast',
+                element=f'<{self.styled_tags[i]} style="{self.styles[i][:40]}...">',
+                location=f'Styled element {i + 1}'
+            )
+    
+    def check_link(self, link, index):
+        """Check link accessibility"""
+        attrs = self._attrs(link)
+        href = attrs.get('href')
+        text = self._text(link).strip()
+        
+        if not href:
+            self._emit(
+                'link_without_href',
+                element=f'<a>{text[:30]}...</a>',
+                location=f'Link {index}'
+            )
+        
+        if not text and not attrs.get('aria-label'):
+            self._emit(
+                'empty_link_text',
+                element=f'<a href="{href}"></a>',
+                location=f'Link {index}'
+            )
+    
+    def check_table(self, table, index):
+        """Check table accessibility"""
+        
+        # Check for table headers
+        if not self._contains(table, 'th'):
+            self._emit(
+                'table_without_headers',
+                element='<table>...</table>',
+                location=f'Table {index}'
+            )
+        
+        # Check for table caption
+        if not self._contains(table, 'caption'):
+            self._emit(
+                'table_without_caption',
+                element='<table>...</table>',
+                location=f'Table {index}'
+            )
+
+class AccessibilityAnalyzerFast(AccessibilityAnalyzer):
+    """Runs the same checks on a selectolax/lexbor tree, keeping DOM queries in C.
+    
+    lexbor repairs malformed markup the way browsers do (HTML5 tree building), while
+    the other backends use libxml2's repairs. On well-formed pages both agree; on
+    malformed ones, such as nested headings, stray elements in tables or in <select>,
+    elements can end up elsewhere in the tree, so issue counts and numbering may differ.
+    """
+    
+    def parse(self, html_content):
+        self.tree = LexborHTMLParser(html_content)
+    
+    def analyze(self):
+        """Run all accessibility checks using lexbor CSS queries"""
+        # Selector lists are wrapped in :is() because lexbor returns plain
+        # comma-separated lists grouped by selector rather than in document order
+        tree = self.tree
+        self.check_styles = self.has_contrast_candidates()
+        self.label_for = {label.attributes.get('for'): label for label in tree.css('label[for]')}
+        
+        for index, img in enumerate(tree.css('img'), 1):
+            self.check_image(img, index)
+        for index, heading in enumerate(tree.css(':is(h1, h2, h3, h4, h5, h6)'), 1):
+            self.check_heading(heading, index)
+        for index, input_elem in enumerate(tree.css(':is(input, textarea, select)'), 1):
+            self.check_form_label(input_elem, index, self._inside_any(input_elem, ('label',)))
+        for name in ('div', 'span'):
+            clickables = tree.css(f'{name}[onclick]')
+            self.clickable_counts[name] = len(clickables)
+            for index, elem in enumerate(clickables, 1):
+                self.check_clickable(elem, index)
+        if self.check_styles:
+            for elem in tree.css('[style]'):
+                self.styled_tags.append(elem.tag)
+                self.styles.append(self._attrs(elem)['style'])
+            self.check_color_contrast_batch()
+        for index, link in enumerate(tree.css('a'), 1):
+            self.check_link(link, index)
+        for index, table in enumerate(tree.css('table'), 1):
+            self.check_table(table, index)
+        
+        self.check_headings()
+        return self._finish()
+    
+    def _inside_any(self, node, tag_names):
+        parent = node.parent
+        while parent is not None:
+            if parent.tag in tag_names:
+                return True
+            parent = parent.parent
+        return False
+    
+    def _name(self, node):
+        return node.tag
+    
+    def _attrs(self, node):
+        # lexbor reports valueless attributes as None where BeautifulSoup gives ''
+        attributes = node.attributes
+        if None in attributes.values():
+            attributes = {key: value or '' for key, value in attributes.items()}
+        return attributes
+    
+    def _text(self, node, limit=None):
+        # text() would include script and style source and keep whitespace-only strings
+        # as they are; collect text nodes like get_text() instead, stopping at limit
+        parts = []
+        length = 0
+        stack = [(node, self._inside_any(node, PRESERVE_WHITESPACE_TAGS))]
+        while stack and not (limit and length >= limit):
+            current, preserve = stack.pop()
+            tag = current.tag
+            if tag == '-text':
+                string = current.text_content
+                parts.append(string if preserve else collapse_whitespace(string))
+                length += len(parts[-1])
+            elif tag not in self.NON_TEXT_TAGS and not tag.startswith('-'):
+                preserve = preserve or tag in PRESERVE_WHITESPACE_TAGS
+                stack.extend((child, preserve) for child in reversed(list(current.iter(include_text=True))))
+        text = ''.join(parts)
+        return text[:limit] if limit else text
+    
+    def _contains(self, node, tag_name):
+        return node.css_first(tag_name) is not None
+
+# lexbor keeps <template> content out of the document tree, so those pages are analyzed with BeautifulSoup
+TEMPLATE_TAG_RE = re.compile(r'<template[\s>]', re.IGNORECASE)
+
+def create_analyzer(url, html_content):
+    """Prefer the lexbor-backed analyzer, falling back to BeautifulSoup when selectolax is missing"""
+    if LexborHTMLParser is not None and not TEMPLATE_TAG_RE.search(html_content):
+        return AccessibilityAnalyzerFast(url, html_content)
+    return AccessibilityAnalyzer(url, html_content)
+
+# Tag name and attributes of a form input whose check waits until all labels are known
+InputSnapshot = collections.namedtuple('InputSnapshot', ('tag', 'attrib'))
+
+class StreamingAccessibilityAnalyzer(AccessibilityAnalyzer):
+    """Runs the checks on lxml parser events as the page is fed in chunks.
+    
+    Every element is cleared once it ends. Open headings, links and clickables
+    keep only a bounded prefix of their text, so memory follows the depth of the
+    open elements rather than the size of the document.
+    """
+    
+    def __init__(self, url, encoding=None):
+        self.styled_count = 0
+        
+        # A declared charset is decoded in Python, which knows more codecs than libxml2; unknown
+        # names fall back to UTF-8 like decode_body. Without one, lxml detects it from the page.
+        self.encoding = None
+        self.decoder = None
+        if encoding:
+            try:
+                self.encoding = codecs.lookup(encoding).name
+            except LookupError:
+                self.encoding = 'utf-8'
+            self.decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        super().__init__(url, '')
+    
+    def parse(self, html_content):
+        self.parser = etree.HTMLPullParser(events=('start', 'end'))
+        self.open_elements = []
+        self.open_tables = {}
+        self.open_prefixes = []
+        self.pending_inputs = []
+        self.label_depth = 0
+        self.skip_depth = 0
+        self.preformatted_depth = 0
+        
+        # Report slot and text of the element whose checks are running in _end
+        self.slot = None
+        self.prefix = None
+        if html_content:
+            self.feed(html_content)
+    
+    def feed(self, chunk):
+        """Parse the next chunk of the page and check every element it completes"""
+        if self.decoder and isinstance(chunk, bytes):
+            try:
+                chunk = self.decoder.decode(chunk)
+            except UnicodeError:
+                # The utf-16/utf-32 decoders reject a stream without a BOM, which
+                # bytes.decode() in decode_body reads as little-endian
+                try:
+                    decoder = codecs.getincrementaldecoder(self.encoding + '-le')
+                except LookupError:
+                    decoder = codecs.getincrementaldecoder('utf-8')
+                self.decoder = decoder(errors='replace')
+                chunk = self.decoder.decode(chunk)
+        self.parser.feed(chunk)
+        self._handle_events()
+    
+    def analyze(self):
+        """Finish parsing and run the checks that need the whole document"""
+        if self.decoder:
+            self.parser.feed(self.decoder.decode(b'', final=True))
+        try:
+            self.parser.close()
+        except etree.XMLSyntaxError:
+            # Raised when no elements were fed at all
+            pass
+        self._handle_events()
+        
+        # Labels may follow the input they point at, so inputs are checked once all labels are known
+        for input_elem, index, in_label in self.pending_inputs:
+            self.check_form_label(input_elem, index, in_label)
+        
+        # Slots of nested elements that were still open when a later row arrived
+        for section, rows in self.sections.items():
+            if any(isinstance(row, list) for row in rows):
+                self.sections[section] = [
+                    filled for row in rows for filled in (row if isinstance(row, list) else (row,))
+                ]
+        
+        self.check_headings()
+        return self._finish()
+    
+    def check_color_contrast(self, elem, index):
+        """Basic color contrast check, run per element so styles are not collected"""
+        style = self._attrs(elem).get('style', '')
+        if 'color:' in style and 'background' in style:
+            self._emit(
+                'contrast',
+                element=f'<{self._name(elem)} style="{style[:40]}...">',
+                location=f'Styled element {index}'
+            )
+    
+    def _handle_events(self):
+        for event, elem in self.parser.read_events():
+            if event == 'start':
+                self._add_text(self._strings_before(elem.getparent(), elem.getprevious()))
+                self._start(elem)
+            else:
+                self._add_text(self._strings_before(elem, elem[-1] if len(elem) else None))
+                self._end(elem)
+    
+    def _strings_before(self, parent, node):
+        """Strings between the last event and the current one: the tail of node, the
+        preceding sibling, or the parent's leading text when there is none"""
+        strings = []
+        # Comments get no events, so their tails are collected here too
+        while node is not None and not isinstance(node.tag, str):
+            strings.append(node.tail)
+            node = node.getprevious()
+        if node is not None:
+            strings.append(node.tail)
+        elif parent is not None:
+            strings.append(parent.text)
+        return [string for string in reversed(strings) if string]
+    
+    def _add_text(self, strings):
+        if self.open_prefixes and not self.skip_depth:
+            for string in strings:
+                if not self.preformatted_depth:
+                    string = collapse_whitespace(string)
+                for prefix in self.open_prefixes:
+                    prefix.add(string)
+    
+    def _reserve(self, section):
+        """Keep the report position of an element whose rows are only known at its end tag"""
+        slot = []
+        self.sections[section].append(slot)
+        return slot
+    
+    def _rows(self, section):
+        return self.slot if self.slot is not None else self.sections[section]
+    
+    def _start(self, elem):
+        name = elem.tag
+        attrib = elem.attrib
+        index = section = prefix = None
+        details = {}
+        
+        if name == 'img':
+            self.image_count += 1
+            self.check_image(elem, self.image_count)
+        elif name in self.HEADING_TAGS:
+            # Levels are compared at start tags, so unclosed headings keep document order
+            self.heading_count += 1
+            current_level = int(name[1])
+            if current_level == 1:
+                self.h1_count += 1
+            prev_level = self.prev_heading_level
             if prev_level > 0 and current_level > prev_level + 1:
-                self.issues.append({
-                    'type': 'Heading Level Skip',
-                    'severity': 'Medium',
-                    'element': f'<{heading.name}>{heading.get_text()[:30]}...</{heading.name}>',
-                    'description': f'Heading jumps from h{prev_level} to h{current_level}',
-                    'impact': 'Breaks logical heading hierarchy',
-                    'solution': 'Use sequential heading levels (h1, h2, h3, etc.)',
-                    'location': f'Heading {i+1}'
-                })
-            prev_level = current_level
-    
-    def check_form_labels(self):
-        """Check for unlabeled form inputs"""
-        inputs = self.soup.find_all(['input', 'textarea', 'select'])
-        
-        for i, input_elem in enumerate(inputs):
-            input_type = input_elem.get('type', 'text')
-            if input_type in ['hidden', 'submit', 'button']:
-                continue
-            
-            input_id = input_elem.get('id')
-            aria_label = input_elem.get('aria-label')
-            aria_labelledby = input_elem.get('aria-labelledby')
+                index = self.heading_count
+                section = 'heading_skips'
+                details = {'prev_level': prev_level, 'current_level': current_level}
+            self.prev_heading_level = current_level
+        elif name in self.FORM_TAGS:
+            self.input_count += 1
+            self.pending_inputs.append((InputSnapshot(name, dict(attrib)), self.input_count, self.label_depth > 0))
+        elif name == 'a':
+            self.link_count += 1
+            index = self.link_count
+            section = 'links'
+        elif name == 'table':
+            self.table_count += 1
+            index = self.table_count
+            section = 'tables'
+            self.open_tables[elem] = set()
+        elif name == 'label':
+            self.label_depth += 1
+            if 'for' in attrib:
+                self.label_for[attrib['for']] = True
+        elif name in ('th', 'caption'):
+            # Same as searching each enclosing table's subtree, nested tables included
+            for parts in self.open_tables.values():
+                parts.add(name)
+        elif name in ('div', 'span') and 'onclick' in attrib:
+            self.clickable_counts[name] += 1
+            index = self.clickable_counts[name]
+            section = f'clickable_{name}s'
+        
+        if 'style' in attrib:
+            self.styled_count += 1
+            self.check_color_contrast(elem, self.styled_count)
+        
+        if name in self.NON_TEXT_TAGS:
+            self.skip_depth += 1
+        elif name in PRESERVE_WHITESPACE_TAGS:
+            self.preformatted_depth += 1
+        
+        slot = None
+        if section is not None:
+            slot = self._reserve(section)
+            if name != 'table':
+                prefix = TextPrefix()
+                self.open_prefixes.append(prefix)
+        self.open_elements.append((index, section, slot, prefix, details))
+    
+    def _end(self, elem):
+        name = elem.tag
+        index, section, slot, prefix, details = self.open_elements.pop()
+        
+        if name in self.NON_TEXT_TAGS:
+            self.skip_depth -= 1
+        elif name in PRESERVE_WHITESPACE_TAGS:
+            self.preformatted_depth -= 1
+        
+        if slot is not None:
+            if prefix is not None:
+                self.open_prefixes.pop()
+            self.slot, self.prefix = slot, prefix
+            if name in self.HEADING_TAGS:
+                self._emit(
+                    'heading_skip',
+                    element=f'<{name}>{self._text(elem, 30)}...</{name}>',
+                    location=f'Heading {index}',
+                    **details
+                )
+            elif name == 'a':
+                self.check_link(elem, index)
+            elif name == 'table':
+                self.check_table(elem, index)
+                del self.open_tables[elem]
+            else:
+                self.check_clickable(elem, index)
+            self.slot = self.prefix = None
             
-            # Check for associated label
-            has_label = False
-            if input_id:
-                label = self.soup.find('label', {'for': input_id})
-                if label:
-                    has_label = True
+            # Without a nested element reserving after it, the slot is last and can be unpacked now
+            rows = self.sections[section]
+            if rows[-1] is slot:
+                rows.pop()
+                rows.extend(slot)
+        elif name == 'label':
+            self.label_depth -= 1
+        
+        # Everything inside elem has been checked, so the finished subtree is always freed
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+    
+    def _name(self, node):
+        return node.tag
+    
+    def _text(self, node, limit=None):
+        # Only the bounded prefix collected while the element was open is available;
+        # without a limit it stands in for the full text in check_link's strip()[:30]
+        return self.prefix.raw[:limit] if limit else self.prefix.text()
+    
+    def _attrs(self, node):
+        return node.attrib
+    
+    def _contains(self, node, tag_name):
+        return tag_name in self.open_tables[node]
+
+# Pages larger than this are truncated rather than read into memory in full
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+MAX_PAGE_MB = MAX_PAGE_BYTES // (1024 * 1024)
+# Streaming keeps little in memory, but still stops at a larger size and a deadline
+MAX_STREAM_BYTES = 50 * 1024 * 1024
+MAX_STREAM_MB = MAX_STREAM_BYTES // (1024 * 1024)
+STREAM_TIME_LIMIT = 60
+CHUNK_SIZE = 64 * 1024
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+BATCH_CONNECTION_LIMIT = 32
+BATCH_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=10, sock_read=10)
+
+def normalize_url(url):
+    """Default to https when no scheme is given"""
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+    return url
+
+def decode_body(body, encoding):
+    """Decode a downloaded page, falling back to UTF-8 for unknown charsets"""
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+@st.cache_resource
+def get_session():
+    """Shared HTTP session so keep-alive connections are reused across analyses"""
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    
+    # The session is shared by every user, so cookies set by one analyzed site must not be kept
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def download_page(url):
+    """Download page HTML and whether it was cut off at MAX_PAGE_BYTES; errors are raised so they are never cached"""
+    with get_session().get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        
+        chunks = []
+        total = 0
+        truncated = False
+        for chunk in response.iter_content(CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > MAX_PAGE_BYTES:
+                truncated = True
+                break
+        
+        body = b''.join(chunks)[:MAX_PAGE_BYTES]
+        return decode_body(body, response.encoding), truncated
+
+def fetch_webpage(url):
+    """Fetch webpage content"""
+    try:
+        url = normalize_url(url)
+        return url, *download_page(url), None
+        
+    except requests.exceptions.RequestException as e:
+        return url, None, False, str(e)
+
+def stream_analysis(url):
+    """Fetch and analyze a page incrementally, without holding the whole document in memory"""
+    try:
+        url = normalize_url(url)
+        with get_session().get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()
             
-            # Check for parent label
-            parent_label = input_elem.find_parent('label')
-            if parent_label:
-                has_label = True
+            # Only trust a declared charset; otherwise let lxml detect it from the page
+            content_type = response.headers.get('content-type', '').lower()
+            encoding = response.encoding if 'charset' in content_type else None
             
-            if not has_label and not aria_label and not aria_labelledby:
-                self.issues.append({
-                    'type': 'Unlabeled Input',
-                    'severity': 'High',
-                    'element': str(input_elem)[:80] + '...',
-                    'description': f'{input_elem.name} element lacks proper labeling',
-                    'impact': 'Users cannot understand the purpose of this input',
-                    'solution': 'Add a label element, aria-label, or aria-labelledby attribute',
-                    'location': f'Form input {i+1}'
-                })
-    
-    def check_clickable_elements(self):
-        """Check for non-semantic clickable elements"""
-        clickable_divs = self.soup.find_all('div', {'onclick': True})
-        clickable_spans = self.soup.find_all('span', {'onclick': True})
-        
-        for i, elem in enumerate(clickable_divs + clickable_spans):
-            role = elem.get('role')
-            tabindex = elem.get('tabindex')
+            analyzer = StreamingAccessibilityAnalyzer(url, encoding)
+            deadline = time.monotonic() + STREAM_TIME_LIMIT
+            total = 0
+            truncated = None
+            for chunk in response.iter_content(CHUNK_SIZE):
+                analyzer.feed(chunk)
+                total += len(chunk)
+                if total >= MAX_STREAM_BYTES:
+                    truncated = f"only the first {MAX_STREAM_MB} MB were analyzed"
+                    break
+                if time.monotonic() > deadline:
+                    truncated = f"only what arrived within {STREAM_TIME_LIMIT} seconds was analyzed"
+                    break
+        
+        analyzer.analyze()
+        return url, analyzer.issues, analyzer.counts, truncated, None
+    
+    except requests.exceptions.RequestException as e:
+        return url, None, None, None, str(e)
+
+def analyze_page(url, html_content):
+    """Parse and analyze a single page, returning its issues and per-severity counts"""
+    analyzer = create_analyzer(url, html_content)
+    analyzer.analyze()
+    return analyzer.issues, analyzer.counts
+
+@st.cache_data(ttl=300, max_entries=128, show_spinner=False)
+def run_analysis(url, html_content):
+    """Analyze a page, reusing the result when the same HTML was analyzed recently"""
+    return analyze_page(url, html_content)
+
+async def _fetch_one(session, semaphore, url):
+    """Fetch a single page for batch mode, with the same size cap as download_page"""
+    try:
+        # The timeout starts once a connection slot is free, so queued URLs do not time out unrequested
+        async with semaphore, session.get(url, timeout=BATCH_REQUEST_TIMEOUT) as response:
+            response.raise_for_status()
             
-            issues_found = []
-            if not role or role not in ['button', 'link']:
-                issues_found.append('missing appropriate role')
-            if tabindex is None or tabindex == '-1':
-                issues_found.append('not keyboard accessible')
+            chunks = []
+            total = 0
+            truncated = False
+            async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total > MAX_PAGE_BYTES:
+                    truncated = True
+                    break
             
-            if issues_found:
-                self.issues.append({
-                    'type': 'Non-semantic Clickable',
-                    'severity': 'High',
-                    'element': f'<{elem.name}>{elem.get_text()[:30]}...</{elem.name}>',
-                    'description': f'Clickable {elem.name} element with issues: {", ".join(issues_found)}',
-                    'impact': 'Element not accessible via keyboard or screen readers',
-                    'solution': 'Use button/a elements or add role="button" and tabindex="0"',
-                    'location': f'Clickable element {i+1}'
-                })
-    
-    def check_color_contrast(self):
-        """Basic color contrast check"""
-        elements_with_style = self.soup.find_all(style=True)
-        
-        for i, elem in enumerate(elements_with_style):
-            style = elem.get('style', '')
-            if 'color:' in style and 'background' in style:
-                self.issues.append({
-                    'type': 'Potential Contrast Issue',
-                    'severity': 'Medium',
-                    'element': f'<{elem.name} style="{style[:40]}...">',
-                    'description': 'Element has custom colors that may have contrast issues',
-                    'impact': 'Text may be difficult to read for visually impaired users',
-                    'solution': 'Verify color contrast ratio meets WCAG standards (4.5:1 for normal text)',
-                    'location': f'Styled element {i+1}'
-                })
-    
-    def check_links(self):
-        """Check link accessibility"""
-        links = self.soup.find_all('a')
+            body = b''.join(chunks)[:MAX_PAGE_BYTES]
+            return url, decode_body(body, response.charset), truncated, None
+    
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        # ValueError covers malformed hosts (e.g. an over-long IDNA label raises UnicodeError).
+        # Some errors (e.g. InvalidURL) carry only the URL, so always name the error type
+        return url, None, False, f'{type(e).__name__}: {e}' if str(e) else type(e).__name__
+
+async def fetch_all(urls):
+    """Fetch all pages concurrently over one connection pool"""
+    connector = aiohttp.TCPConnector(limit=BATCH_CONNECTION_LIMIT)
+    semaphore = asyncio.Semaphore(BATCH_CONNECTION_LIMIT)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        cookie_jar=aiohttp.DummyCookieJar(),
+        headers={'User-Agent': USER_AGENT}
+    ) as session:
+        return await asyncio.gather(*[_fetch_one(session, semaphore, url) for url in urls])
+
+def analyze_batch(urls):
+    """Fetch pages concurrently, then parse and analyze them on a thread pool"""
+    pages = asyncio.run(fetch_all([normalize_url(url) for url in urls]))
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [
+            pool.submit(analyze_page, url, html_content) if html_content else None
+            for url, html_content, truncated, error in pages
+        ]
         
-        for i, link in enumerate(links):
-            href = link.get('href')
-            text = link.get_text().strip()
-            
-            if not href:
-                self.issues.append({
-                    'type': 'Link Without Href',
-                    'severity': 'Medium',
-                    'element': f'<a>{text[:30]}...</a>',
-                    'description': 'Link element missing href attribute',
-                    'impact': 'Link is not functional for keyboard users',
-                    'solution': 'Add href attribute or use button element instead',
-                    'location': f'Link {i+1}'
-                })
+        for (url, html_content, truncated, error), future in zip(pages, futures):
+            if error:
+                results.append((url, empty_issues(), empty_counts(), False, error))
+            elif future is None:
+                results.append((url, empty_issues(), empty_counts(), False, 'No content received from website'))
+            else:
+                results.append((url, *future.result(), truncated, None))
+    
+    return results
+
+def to_csv_bytes(table):
+    """Serialize an Arrow table to CSV with pyarrow's native writer"""
+    sink = io.BytesIO()
+    pacsv.write_csv(table, sink)
+    return sink.getvalue()
+
+def display_issues(issues, rows, severity_color="red"):
+    """Render one expander per issue, given row indices into the columnar store"""
+    if not rows:
+        st.info(f"🎉 No {severity_color} priority issues found!")
+        return
+    
+    for i, row in enumerate(rows):
+        severity = issues['Severity'][row]
+        location = issues['Location'][row]
+        with st.expander(f"**{issues['Type'][row]}** - {location}", expanded=i < 3):
+            col1, col2 = st.columns([3, 1])
             
-            if not text and not link.get('aria-label'):
-                self.issues.append({
-                    'type': 'Empty Link Text',
-                    'severity': 'High',
-                    'element': f'<a href="{href}"></a>',
-                    'description': 'Link has no accessible text',
-                    'impact': 'Screen readers cannot describe the link purpose',
-                    'solution': 'Add descriptive text or aria-label attribute',
-                    'location': f'Link {i+1}'
-                })
-    
-    def check_tables(self):
-        """Check table accessibility"""
-        tables = self.soup.find_all('table')
-        
-        for i, table in enumerate(tables):
-            # Check for table headers
-            headers = table.find_all('th')
-            if not headers:
-                self.issues.append({
-                    'type': 'Table Without Headers',
-                    'severity': 'Medium',
-                    'element': '<table>...</table>',
-                    'description': 'Table missing header cells (th elements)',
-                    'impact': 'Screen readers cannot properly navigate table data',
-                    'solution': 'Add th elements for column/row headers',
-                    'location': f'Table {i+1}'
-                })
+            with col1:
+                st.markdown(f"**Description:** {issues['Description'][row]}")
+                st.code(issues['Element'][row], language='html')
+                st.markdown(f"**Impact:** {issues['Impact'][row]}")
+                st.markdown(f"**Solution:** {issues['Solution'][row]}")
             
-            # Check for table caption
-            caption = table.find('caption')
-            if not caption:
-                self.issues.append({
-                    'type': 'Table Without Caption',
-                    'severity': 'Low',
-                    'element': '<table>...</table>',
-                    'description': 'Table missing caption element',
-                    'impact': 'Users may not understand table purpose',
-                    'solution': 'Add caption element describing table content',
-                    'location': f'Table {i+1}'
-                })
+            with col2:
+                severity_color_map = {
+                    'High': 'red',
+                    'Medium': 'orange', 
+                    'Low': 'blue'
+                }
+                st.markdown(f"**Severity**")
+                st.markdown(f":{severity_color_map[severity]}[{severity}]")
+                st.markdown(f"**Location**")
+                st.markdown(location)
 
-def fetch_webpage(url):
-    """Fetch webpage content"""
-    try:
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
+SEVERITY_SECTIONS = {
+    'High': (
+        "### 🔴 High Priority Issues",
+        "These issues create significant barriers for users with disabilities and should be fixed immediately."
+    ),
+    'Medium': (
+        "### 🟡 Medium Priority Issues",
+        "These issues impact usability and should be addressed soon."
+    ),
+    'Low': (
+        "### 🔵 Low Priority Issues",
+        "These are minor improvements that enhance accessibility."
+    )
+}
+
+def display_results(final_url, issues, counts, truncated=None):
+    """Show summary metrics and the currently selected issue view"""
+    # Severity counts are kept by the analyzer as issues are recorded
+    high_count, medium_count, low_count = counts['High'], counts['Medium'], counts['Low']
+    total_issues = len(issues['Severity'])
+    
+    # Display results
+    st.success(f"✅ **Analysis completed for:** {final_url}")
+    if truncated:
+        st.warning(f"⚠️ **Page truncated:** {truncated}, so issues later in the page are not reported.")
+    
+    # Summary metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Issues", total_issues)
+    with col2:
+        st.metric("High Priority", high_count, delta=f"-{high_count}" if high_count else "0")
+    with col3:
+        st.metric("Medium Priority", medium_count, delta=f"-{medium_count}" if medium_count else "0")
+    with col4:
+        st.metric("Low Priority", low_count, delta=f"-{low_count}" if low_count else "0")
+    
+    if not total_issues:
+        st.success("🎉 **Congratulations!** No accessibility issues found!")
+        st.info("This website appears to follow good accessibility practices.")
+        return
+    
+    # Only the selected view is rendered; the selection is kept in session_state across reruns
+    view_labels = {
+        'High': f"🔴 High Priority ({high_count})",
+        'Medium': f"🟡 Medium Priority ({medium_count})",
+        'Low': f"🔵 Low Priority ({low_count})",
+        'All': f"📊 All Issues ({total_issues})"
+    }
+    view = st.radio(
+        "Issues to show",
+        list(view_labels),
+        format_func=view_labels.get,
+        horizontal=True,
+        key='issue_view',
+        label_visibility="collapsed"
+    )
+    
+    if view == 'All':
+        st.markdown("### 📊 All Issues Summary")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # Create DataFrame for download straight from the columns
+        df = pd.DataFrame(issues, columns=REPORT_COLUMNS)
+        st.dataframe(df, use_container_width=True)
         
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        return url, response.text, None
+        # Download button
+        csv = to_csv_bytes(pa.table({column: issues[column] for column in REPORT_COLUMNS}))
+        st.download_button(
+            label="📥 Download Report as CSV",
+            data=csv,
+            file_name=f"accessibility_report_{urlparse(final_url).netloc}_{int(time.time())}.csv",
+            mime="text/csv"
+        )
+    else:
+        title, summary = SEVERITY_SECTIONS[view]
+        st.markdown(title)
+        st.markdown(summary)
         
-    except requests.exceptions.RequestException as e:
-        return url, None, str(e)
+        # Only the selected severity's rows are materialized
+        rows = [row for row, severity in enumerate(issues['Severity']) if severity == view]
+        display_issues(issues, rows, view.lower())
+
+def single_analysis():
+    """Analyze one website and show its issues"""
+    # Main content
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.header("🌐 Enter Website URL")
+        url = st.text_input(
+            "Website URL to analyze:",
+            placeholder="https://example.com",
+            help="Enter the full URL of the website you want to analyze"
+        )
+    
+    with col2:
+        st.header("🚀 Analysis")
+        analyze_button = st.button("Analyze Website", type="primary", use_container_width=True)
+        streaming = st.checkbox(
+            "Stream large pages",
+            help=(
+                f"Analyze the page while it downloads, up to {MAX_STREAM_MB} MB or "
+                f"{STREAM_TIME_LIMIT} seconds instead of the {MAX_PAGE_MB} MB download limit"
+            )
+        )
+    
+    if analyze_button and url:
+        with st.spinner("🔍 Fetching and analyzing website..."):
+            if streaming:
+                final_url, issues, counts, truncated, error = stream_analysis(url)
+                
+                if error:
+                    st.session_state.pop('analysis', None)
+                    st.error(f"❌ **Error fetching website:** {error}")
+                    return
+            else:
+                # Fetch webpage
+                final_url, html_content, page_truncated, error = fetch_webpage(url)
+                
+                if error:
+                    st.session_state.pop('analysis', None)
+                    st.error(f"❌ **Error fetching website:** {error}")
+                    return
+                
+                if not html_content:
+                    st.session_state.pop('analysis', None)
+                    st.error("❌ **No content received from website**")
+                    return
+                
+                # Analyze accessibility
+                issues, counts = run_analysis(final_url, html_content)
+                truncated = f"only the first {MAX_PAGE_MB} MB were analyzed" if page_truncated else None
+        
+        # Keep the result so switching views (which reruns the script) does not re-analyze
+        st.session_state['analysis'] = (final_url, issues, counts, truncated)
+        if not issues['Severity']:
+            st.balloons()
+    
+    elif analyze_button and not url:
+        st.warning("⚠️ Please enter a website URL to analyze.")
+        return
+    
+    if 'analysis' in st.session_state:
+        display_results(*st.session_state['analysis'])
+
+def display_batch_results(results):
+    """Show the per-site summary and the combined issue table for a batch run"""
+    summary_data = []
+    page_frames = []
+    truncated_urls = []
+    for page_url, issues, counts, truncated, error in results:
+        total_issues = len(issues['Severity'])
+        if error:
+            status = f'❌ {error}'
+        elif truncated:
+            status = '⚠️ Analyzed (truncated)'
+            truncated_urls.append(page_url)
+        else:
+            status = '✅ Analyzed'
+        summary_data.append({
+            'URL': page_url,
+            'Status': status,
+            'Total Issues': total_issues,
+            'High': counts['High'],
+            'Medium': counts['Medium'],
+            'Low': counts['Low']
+        })
+        if total_issues:
+            page_df = pd.DataFrame(issues, columns=REPORT_COLUMNS)
+            page_df.insert(0, 'URL', page_url)
+            page_frames.append(page_df)
+    
+    st.success(f"✅ **Analysis completed for {len(results)} websites**")
+    if truncated_urls:
+        st.warning(
+            f"⚠️ **Pages truncated:** only the first {MAX_PAGE_MB} MB of these pages were analyzed, "
+            "so issues later in them are not reported:\n\n" + "\n".join(f"- {page_url}" for page_url in truncated_urls)
+        )
+    st.markdown("### 📋 Summary")
+    st.dataframe(pd.DataFrame(summary_data), use_container_width=True)
+    
+    if page_frames:
+        st.markdown("### 📊 All Issues")
+        df = pd.concat(page_frames, ignore_index=True)
+        st.dataframe(df, use_container_width=True)
+        
+        csv = to_csv_bytes(pa.Table.from_pandas(df, preserve_index=False))
+        st.download_button(
+            label="📥 Download Batch Report as CSV",
+            data=csv,
+            file_name=f"accessibility_batch_report_{int(time.time())}.csv",
+            mime="text/csv"
+        )
+
+def batch_analysis():
+    """Analyze several websites in one run"""
+    st.header("🌐 Enter Website URLs")
+    urls_text = st.text_area(
+        "Website URLs to analyze (one per line):",
+        placeholder="https://example.com\nhttps://example.org",
+        height=150,
+        help="Pages are fetched concurrently and analyzed in parallel"
+    )
+    analyze_button = st.button("Analyze Websites", type="primary")
+    urls = list(dict.fromkeys(line.strip() for line in urls_text.splitlines() if line.strip()))
+    
+    if analyze_button and urls:
+        with st.spinner(f"🔍 Fetching and analyzing {len(urls)} websites..."):
+            # Kept so reruns (e.g. from the download button) still show the results
+            st.session_state['batch_results'] = analyze_batch(urls)
+    
+    elif analyze_button and not urls:
+        st.warning("⚠️ Please enter at least one website URL to analyze.")
+        return
+    
+    if 'batch_results' in st.session_state:
+        display_batch_results(st.session_state['batch_results'])
 
 def main():
     # Header
@@ -312,142 +1329,11 @@ def main():
         st.warning("**Medium:** Important usability issues")
         st.info("**Low:** Minor improvements needed")
     
-    # Main content
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        st.header("🌐 Enter Website URL")
-        url = st.text_input(
-            "Website URL to analyze:",
-            placeholder="https://example.com",
-            help="Enter the full URL of the website you want to analyze"
-        )
-    
-    with col2:
-        st.header("🚀 Analysis")
-        analyze_button = st.button("Analyze Website", type="primary", use_container_width=True)
-    
-    if analyze_button and url:
-        with st.spinner("🔍 Fetching and analyzing website..."):
-            # Fetch webpage
-            final_url, html_content, error = fetch_webpage(url)
-            
-            if error:
-                st.error(f"❌ **Error fetching website:** {error}")
-                return
-            
-            if not html_content:
-                st.error("❌ **No content received from website**")
-                return
-            
-            # Analyze accessibility
-            analyzer = AccessibilityAnalyzer(final_url, html_content)
-            issues = analyzer.analyze()
-            
-            # Categorize issues
-            high_issues = [issue for issue in issues if issue['severity'] == 'High']
-            medium_issues = [issue for issue in issues if issue['severity'] == 'Medium']
-            low_issues = [issue for issue in issues if issue['severity'] == 'Low']
-            
-            # Display results
-            st.success(f"✅ **Analysis completed for:** {final_url}")
-            
-            # Summary metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Issues", len(issues))
-            with col2:
-                st.metric("High Priority", len(high_issues), delta=f"-{len(high_issues)}" if high_issues else "0")
-            with col3:
-                st.metric("Medium Priority", len(medium_issues), delta=f"-{len(medium_issues)}" if medium_issues else "0")
-            with col4:
-                st.metric("Low Priority", len(low_issues), delta=f"-{len(low_issues)}" if low_issues else "0")
-            
-            if not issues:
-                st.balloons()
-                st.success("🎉 **Congratulations!** No accessibility issues found!")
-                st.info("This website appears to follow good accessibility practices.")
-                return
-            
-            # Tabs for different severity levels
-            tab1, tab2, tab3, tab4 = st.tabs([
-                f"🔴 High Priority ({len(high_issues)})",
-                f"🟡 Medium Priority ({len(medium_issues)})",
-                f"🔵 Low Priority ({len(low_issues)})",
-                f"📊 All Issues ({len(issues)})"
-            ])
-            
-            def display_issues(issues_list, severity_color="red"):
-                if not issues_list:
-                    st.info(f"🎉 No {severity_color} priority issues found!")
-                    return
-                
-                for i, issue in enumerate(issues_list):
-                    with st.expander(f"**{issue['type']}** - {issue['location']}", expanded=i < 3):
-                        col1, col2 = st.columns([3, 1])
-                        
-                        with col1:
-                            st.markdown(f"**Description:** {issue['description']}")
-                            st.code(issue['element'], language='html')
-                            st.markdown(f"**Impact:** {issue['impact']}")
-                            st.markdown(f"**Solution:** {issue['solution']}")
-                        
-                        with col2:
-                            severity_color_map = {
-                                'High': 'red',
-                                'Medium': 'orange', 
-                                'Low': 'blue'
-                            }
-                            st.markdown(f"**Severity**")
-                            st.markdown(f":{severity_color_map[issue['severity']]}[{issue['severity']}]")
-                            st.markdown(f"**Location**")
-                            st.markdown(issue['location'])
-            
-            with tab1:
-                st.markdown("### 🔴 High Priority Issues")
-                st.markdown("These issues create significant barriers for users with disabilities and should be fixed immediately.")
-                display_issues(high_issues, "high")
-            
-            with tab2:
-                st.markdown("### 🟡 Medium Priority Issues")
-                st.markdown("These issues impact usability and should be addressed soon.")
-                display_issues(medium_issues, "medium")
-            
-            with tab3:
-                st.markdown("### 🔵 Low Priority Issues")
-                st.markdown("These are minor improvements that enhance accessibility.")
-                display_issues(low_issues, "low")
-            
-            with tab4:
-                st.markdown("### 📊 All Issues Summary")
-                
-                # Create DataFrame for download
-                df_data = []
-                for issue in issues:
-                    df_data.append({
-                        'Type': issue['type'],
-                        'Severity': issue['severity'],
-                        'Location': issue['location'],
-                        'Description': issue['description'],
-                        'Impact': issue['impact'],
-                        'Solution': issue['solution']
-                    })
-                
-                if df_data:
-                    df = pd.DataFrame(df_data)
-                    st.dataframe(df, use_container_width=True)
-                    
-                    # Download button
-                    csv = df.to_csv(index=False)
-                    st.download_button(
-                        label="📥 Download Report as CSV",
-                        data=csv,
-                        file_name=f"accessibility_report_{urlparse(final_url).netloc}_{int(time.time())}.csv",
-                        mime="text/csv"
-                    )
-    
-    elif analyze_button and not url:
-        st.warning("⚠️ Please enter a website URL to analyze.")
+    mode = st.radio("Analysis mode", ["Single website", "Batch"], horizontal=True)
+    if mode == "Batch":
+        batch_analysis()
+    else:
+        single_analysis()
     
     # Footer
     st.markdown("---")
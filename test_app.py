@@ -0,0 +1,143 @@
+import pytest
+
+import app
+
+# Exercises every check, plus text that BeautifulSoup leaves out of get_text()
+FIXTURE_PAGE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Fixture</title>
+    <style>body { color: black; }</style>
+    <script>var analytics = 1;</script>
+</head>
+<body>
+    <span onclick="open()">Menu</span>
+    <h2>Welcome</h2>
+    <img src="logo.png">
+    <img src="spacer.gif" alt="">
+    <img src="photo.jpg" alt="A photo">
+    <h4><script>var secret = 1;</script>Latest <!-- draft -->news<rt>nyu-su</rt></h4>
+    <h1>Main</h1>
+    <h1>Second main</h1>
+    <div onclick="go()" style="color:red;background:white">Click <b>here</b> for more details about us</div>
+    <div onclick="go()" role="button" tabindex="0">Accessible</div>
+    <p style="color&#58;blue;background:yellow">Encoded style</p>
+    <p style="margin: 0">Plain style</p>
+    <form>
+        <input type="text" name="query">
+        <label>Email <input type="email" name="email"></label>
+        <input type="hidden" name="token">
+        <input type="submit" value="Send">
+        <textarea id="bio"></textarea>
+        <select aria-label="Country"><option>A</option></select>
+        <input id="late" type="text">
+    </form>
+    <label for="bio">Bio</label>
+    <label for="late">Late</label>
+    <a href="/home">Home</a>
+    <a href="/styled"><style>.icon { color: red; }</style></a>
+    <a href="/scripted"><script>track();</script> <!-- icon --></a>
+    <a>Anchor <b>without<script>x()</script></b> href</a>
+    <a href="/labelled" aria-label="Labelled"></a>
+    <table><tr><td>No headers</td></tr></table>
+    <table><caption>Data</caption><tr><th>Head</th></tr><tr><td><table><tr><th>Inner</th></tr></table></td></tr></table>
+    <span onclick="close()" tabindex="-1">Close</span>
+</body>
+</html>
+"""
+
+# Pages whose elements close out of document order; libxml2 repairs them the same way
+# for BeautifulSoup and the streaming parser, while lexbor may build a different tree
+NESTED_PAGES = [
+    '<h1>Title<h3>Sub</h3><p>x</p>',
+    '<h2>A<h4>B</h4></h2><h1>Main</h1>',
+    '<h1>One<h2>Two<h5>Five',
+    '<div onclick="a()">Outer <span onclick="b()">inner</span> <div onclick="c()">deep</div></div>',
+    '<a>Outer <div onclick="a()"><a href="/x"></a></div></a><a href="/y"> </a>',
+    '<table><tr><td><table><tr><td>inner</td></tr></table><table><caption>c</caption><tr><th>h</th></tr></table></td></tr></table>',
+    '<div onclick="a()"><table><tr><td><h3>Cell <span onclick="b()">x</span></h3></td></tr></table>',
+]
+
+
+def rows(issues):
+    return list(zip(*(issues[column] for column in app.ISSUE_COLUMNS)))
+
+
+def analyze_streaming(html_content, chunk_size=16):
+    analyzer = app.StreamingAccessibilityAnalyzer('https://example.com', 'utf-8')
+    data = html_content.encode('utf-8')
+    for start in range(0, len(data), chunk_size):
+        analyzer.feed(data[start:start + chunk_size])
+    return analyzer.analyze()
+
+
+def test_backends_report_identical_issues():
+    expected = rows(app.AccessibilityAnalyzer('https://example.com', FIXTURE_PAGE).analyze())
+    assert rows(app.AccessibilityAnalyzerFast('https://example.com', FIXTURE_PAGE).analyze()) == expected
+    assert rows(analyze_streaming(FIXTURE_PAGE)) == expected
+
+
+@pytest.mark.parametrize('html_content', NESTED_PAGES)
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_streaming_reports_nested_elements_in_document_order(html_content, chunk_size):
+    expected = rows(app.AccessibilityAnalyzer('https://example.com', html_content).analyze())
+    assert rows(analyze_streaming(html_content, chunk_size)) == expected
+
+
+def test_issues_are_grouped_by_check():
+    issues = app.AccessibilityAnalyzer('https://example.com', FIXTURE_PAGE).analyze()
+    report = list(zip(issues['Type'], issues['Location']))
+    assert report == [
+        ('Missing Alt Text', 'Image 1'),
+        ('Empty Alt Text', 'Image 2'),
+        ('Multiple H1', 'Multiple locations'),
+        ('Heading Level Skip', 'Heading 2'),
+        ('Unlabeled Input', 'Form input 1'),
+        ('Non-semantic Clickable', 'Clickable element 1'),
+        ('Non-semantic Clickable', 'Clickable element 3'),
+        ('Non-semantic Clickable', 'Clickable element 4'),
+        ('Potential Contrast Issue', 'Styled element 1'),
+        ('Potential Contrast Issue', 'Styled element 2'),
+        ('Empty Link Text', 'Link 2'),
+        ('Empty Link Text', 'Link 3'),
+        ('Link Without Href', 'Link 4'),
+        ('Table Without Headers', 'Table 1'),
+        ('Table Without Caption', 'Table 1'),
+        ('Table Without Caption', 'Table 3'),
+    ]
+
+
+def test_previews_leave_out_script_source():
+    issues = app.AccessibilityAnalyzerFast('https://example.com', FIXTURE_PAGE).analyze()
+    elements = dict(zip(issues['Location'], issues['Element']))
+    assert elements['Heading 2'] == '<h4>Latest news...</h4>'
+    assert elements['Link 4'] == '<a>Anchor without href...</a>'
+
+
+def test_template_pages_fall_back_to_beautifulsoup():
+    html_content = '<h1>Page</h1><template><img src="row.png"></template>'
+    analyzer = app.create_analyzer('https://example.com', html_content)
+    assert type(analyzer) is app.AccessibilityAnalyzer
+    assert analyzer.analyze()['Type'] == ['Missing Alt Text']
+
+
+def test_streaming_falls_back_to_utf8_for_unknown_charsets():
+    analyzer = app.StreamingAccessibilityAnalyzer('https://example.com', 'x-bogus-charset')
+    analyzer.feed('<h1>Café</h1><h3>Menü</h3>'.encode('utf-8'))
+    issues = analyzer.analyze()
+    assert issues['Element'] == ['<h3>Menü...</h3>']
+
+
+def test_whitespace_only_strings_are_collapsed_like_beautifulsoup():
+    html_content = '<span onclick="f()">\n  <b> </b>\tMenu</span><pre><span onclick="f()"> \n</span></pre>'
+    expected = app.AccessibilityAnalyzer('https://example.com', html_content).analyze()['Element']
+    assert expected[1:] == ['<span>\n \tMenu...</span>', '<span> \n...</span>']
+    assert app.AccessibilityAnalyzerFast('https://example.com', html_content).analyze()['Element'] == expected
+
+
+def test_streaming_reads_utf16_without_bom_as_little_endian():
+    data = '<h1>Café</h1><h3>Menü</h3>'.encode('utf-16-le')
+    analyzer = app.StreamingAccessibilityAnalyzer('https://example.com', 'utf-16')
+    for start in range(0, len(data), 5):
+        analyzer.feed(data[start:start + 5])
+    assert analyzer.analyze()['Element'] == ['<h3>Menü...</h3>']